@@ -1,23 +1,31 @@
 #!/usr/bin/env python3
 """Add app_links package to pubspec.yaml"""
 
-pubspec_path = 'c:/RS_Flutter/rs_flutter/pubspec.yaml'
+from codemod_journal import Journal
+from file_discovery import REPO_ROOT
 
-with open(pubspec_path, 'r', encoding='utf-8') as f:
-    content = f.read()
-
-# Add app_links after flutter_local_notifications
-if 'app_links:' not in content:
-    old_text = '  flutter_local_notifications: ^18.0.1'
-    new_text = '''  flutter_local_notifications: ^18.0.1
+# app_links goes right after flutter_local_notifications
+OLD_TEXT = '  flutter_local_notifications: ^18.0.1'
+NEW_TEXT = '''  flutter_local_notifications: ^18.0.1
 
   # Deep Links for email notifications
   app_links: ^6.3.3'''
 
-    content = content.replace(old_text, new_text)
+def main():
+    with Journal('add_app_links') as journal:
+        pubspec_path = REPO_ROOT / 'pubspec.yaml'
+
+        with open(pubspec_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+
+        # Add app_links after flutter_local_notifications
+        if 'app_links:' not in content:
+            content = content.replace(OLD_TEXT, NEW_TEXT)
+
+            journal.write_text(pubspec_path, content)
+            print("[OK] Added app_links package to pubspec.yaml")
+        else:
+            print("[OK] app_links already in pubspec.yaml")
 
-    with open(pubspec_path, 'w', encoding='utf-8') as f:
-        f.write(content)
-    print("[OK] Added app_links package to pubspec.yaml")
-else:
-    print("[OK] app_links already in pubspec.yaml")
+if __name__ == '__main__':
+    main()
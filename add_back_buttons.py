@@ -1,54 +1,66 @@
 #!/usr/bin/env python3
 """
 Add back buttons to all Flutter pages that don't have them.
-Excludes main navigation pages: home_page, info_page, settings_page
+Main navigation pages are excluded by the 'back-buttons' rule in file_discovery.py
 """
 
+import functools
 import os
 import re
+import sys
 from pathlib import Path
 
-# Pages that should NOT have back buttons (main navigation pages)
-EXCLUDED_PAGES = [
-    'home_page.dart',
-    'main_navigation.dart',
-    # Info and Settings can have back buttons since they're accessed from navigation
+from codemod_journal import Journal
+from file_discovery import REPO_ROOT, discover
+from result_sink import ResultSink, pop_results_option
+
+# Compiled once at import; these run against every file in the sweep
+IMPORT_PATTERN = re.compile(r"^import [^\n]+;$", re.MULTILINE)
+BACK_BUTTON_PATTERNS = [
+    re.compile(r'CustomBackButton', re.DOTALL),
+    re.compile(r'IconButton.*Icons\.arrow_back', re.DOTALL),
+    re.compile(r'leading:.*IconButton', re.DOTALL),
 ]
+# AppBar without leading
+APPBAR_PATTERN = re.compile(r'(AppBar\s*\([^)]*?)(\))', re.DOTALL)
+# Custom headers with Row and no back button
+CUSTOM_HEADER_PATTERN = re.compile(
+    r'(// Custom Header.*?Row\s*\(\s*children:\s*\[)([^\]]+?)(\],?\s*\),)', re.DOTALL
+)
+
+BACK_BUTTON_WIDGET = REPO_ROOT / 'lib' / 'widgets' / 'custom_back_button.dart'
+
+def back_button_import(filepath):
+    """Import line for CustomBackButton, relative to the file's own directory"""
+    relative = os.path.relpath(BACK_BUTTON_WIDGET, Path(filepath).resolve().parent)
+    return f"import '{Path(relative).as_posix()}';"
 
-def add_back_button_import(content):
+def add_back_button_import(content, import_line):
     """Add CustomBackButton import if not present"""
-    if "import '../widgets/custom_back_button.dart'" in content:
+    if import_line in content:
         return content  # Already imported
 
     # Find the last import statement
-    imports = re.findall(r"^import [^\n]+;$", content, re.MULTILINE)
+    imports = IMPORT_PATTERN.findall(content)
     if imports:
         last_import = imports[-1]
         # Add our import after the last import
         content = content.replace(
             last_import,
-            last_import + "\nimport '../widgets/custom_back_button.dart';"
+            last_import + "\n" + import_line
         )
 
     return content
 
 def has_back_button(content):
     """Check if page already has a back button"""
-    patterns = [
-        r'CustomBackButton',
-        r'IconButton.*Icons\.arrow_back',
-        r'leading:.*IconButton',
-    ]
-    for pattern in patterns:
-        if re.search(pattern, content, re.DOTALL):
+    for pattern in BACK_BUTTON_PATTERNS:
+        if pattern.search(content):
             return True
     return False
 
 def add_back_button_to_appbar(content):
     """Add back button to AppBar if it doesn't have one"""
-    # Pattern to find AppBar without leading
-    appbar_pattern = r'(AppBar\s*\([^)]*?)(\))'
-
     def add_leading(match):
         appbar_content = match.group(1)
         closing_paren = match.group(2)
@@ -70,14 +82,11 @@ def add_back_button_to_appbar(content):
             # No parameters yet, add as first parameter
             return appbar_content + '\n      leading: const CustomBackButton(),' + closing_paren
 
-    content = re.sub(appbar_pattern, add_leading, content, flags=re.DOTALL)
+    content = APPBAR_PATTERN.sub(add_leading, content)
     return content
 
 def add_back_button_to_custom_header(content):
     """Add back button to custom header (like info_page style)"""
-    # Look for custom headers with Row and no back button
-    header_pattern = r'(// Custom Header.*?Row\s*\(\s*children:\s*\[)([^\]]+?)(\],?\s*\),)'
-
     def add_button(match):
         comment = match.group(1)
         children_content = match.group(2)
@@ -91,74 +100,54 @@ def add_back_button_to_custom_header(content):
         new_children = f"\n                const CustomBackButton(),\n                const SizedBox(width: 8),{children_content}"
         return comment + new_children + closing
 
-    content = re.sub(header_pattern, add_button, content, flags=re.DOTALL)
+    content = CUSTOM_HEADER_PATTERN.sub(add_button, content)
     return content
 
-def process_file(filepath):
-    """Process a single Dart file"""
+def process_file(filepath, journal):
+    """Process a single Dart file; return [(action, finding)]"""
     try:
         with open(filepath, 'r', encoding='utf-8') as f:
             content = f.read()
 
-        # Skip if excluded
-        if any(excluded in filepath.name for excluded in EXCLUDED_PAGES):
-            print(f"  Skipped (excluded): {filepath.name}")
-            return False
-
         # Skip if already has back button
         if has_back_button(content):
-            print(f"  Skipped (has back button): {filepath.name}")
-            return False
+            return [('skipped', 'has back button')]
 
         # Skip if no Scaffold (not a page)
         if 'Scaffold' not in content:
-            print(f"  Skipped (no Scaffold): {filepath.name}")
-            return False
+            return [('skipped', 'no Scaffold')]
 
         original_content = content
 
-        # Add import
-        content = add_back_button_import(content)
-
         # Try to add to AppBar
         content = add_back_button_to_appbar(content)
 
         # Try to add to custom header
         content = add_back_button_to_custom_header(content)
 
-        # Only write if changed
+        # Only write (and import the widget) if a button was inserted
         if content != original_content:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(content)
-            print(f"  SUCCESS: Updated {filepath.name}")
-            return True
+            content = add_back_button_import(content, back_button_import(filepath))
+            journal.write_text(filepath, content)
+            return [('updated', None)]
         else:
-            print(f"  Skipped (no changes): {filepath.name}")
-            return False
+            return [('skipped', 'no changes')]
 
     except Exception as e:
-        print(f"  ERROR: Error processing {filepath.name}: {e}")
-        return False
+        return [('error', f"Error processing: {e}")]
 
-def main():
-    pages_dir = Path('lib/pages')
-
-    if not pages_dir.exists():
-        print("Error: lib/pages directory not found")
-        return
+def main(argv=None):
+    results, args = pop_results_option(sys.argv[1:] if argv is None else argv)
+    if args:
+        print("Usage: python add_back_buttons.py [--results PATH]")
+        return 2
 
     print("Adding back buttons to Flutter pages...")
-    print()
-
-    dart_files = list(pages_dir.glob('*.dart'))
-    updated_count = 0
 
-    for filepath in sorted(dart_files):
-        if process_file(filepath):
-            updated_count += 1
+    dart_files = discover('back-buttons')
 
-    print()
-    print(f"Summary: Updated {updated_count} out of {len(dart_files)} pages")
+    with Journal('add_back_buttons') as journal, ResultSink('back-buttons', results) as sink:
+        sink.run(functools.partial(process_file, journal=journal), dart_files)
 
 if __name__ == '__main__':
-    main()
+    sys.exit(main())
@@ -1,20 +1,17 @@
 #!/usr/bin/env python3
 """Add deep link configuration to Android and iOS"""
 
-# ==== ANDROID ====
-android_path = 'c:/RS_Flutter/rs_flutter/android/app/src/main/AndroidManifest.xml'
+from codemod_journal import Journal
+from file_discovery import REPO_ROOT
 
-with open(android_path, 'r', encoding='utf-8') as f:
-    android_content = f.read()
-
-# Add deep link intent-filter to Android
-old_android = '''            <intent-filter>
+# Deep link intent-filter added to the Android launcher activity
+OLD_ANDROID = '''            <intent-filter>
                 <action android:name="android.intent.action.MAIN"/>
                 <category android:name="android.intent.category.LAUNCHER"/>
             </intent-filter>
         </activity>'''
 
-new_android = '''            <intent-filter>
+NEW_ANDROID = '''            <intent-filter>
                 <action android:name="android.intent.action.MAIN"/>
                 <category android:name="android.intent.category.LAUNCHER"/>
             </intent-filter>
@@ -27,26 +24,8 @@ new_android = '''            <intent-filter>
             </intent-filter>
         </activity>'''
 
-if old_android in android_content:
-    android_content = android_content.replace(old_android, new_android)
-    with open(android_path, 'w', encoding='utf-8') as f:
-        f.write(android_content)
-    print("[OK] Android: Added deep link intent-filter")
-elif 'android:scheme="recallsentry"' in android_content:
-    print("[OK] Android: Deep links already configured")
-else:
-    print("[ERROR] Android: Could not find expected pattern")
-
-# ==== iOS ====
-ios_path = 'c:/RS_Flutter/rs_flutter/ios/Runner/Info.plist'
-
-with open(ios_path, 'r', encoding='utf-8') as f:
-    ios_content = f.read()
-
-# Add CFBundleURLTypes for iOS deep links
-if 'CFBundleURLTypes' not in ios_content:
-    # Insert before closing </dict></plist>
-    url_types = '''	<key>CFBundleURLTypes</key>
+# CFBundleURLTypes for iOS deep links
+IOS_URL_TYPES = '''	<key>CFBundleURLTypes</key>
 	<array>
 		<dict>
 			<key>CFBundleTypeRole</key>
@@ -60,15 +39,46 @@ if 'CFBundleURLTypes' not in ios_content:
 		</dict>
 	</array>
 '''
-    ios_content = ios_content.replace('</dict>\n</plist>', url_types + '</dict>\n</plist>')
-    with open(ios_path, 'w', encoding='utf-8') as f:
-        f.write(ios_content)
-    print("[OK] iOS: Added CFBundleURLTypes for deep links")
-else:
-    print("[OK] iOS: CFBundleURLTypes already exists")
 
-print("")
-print("Deep link configuration complete!")
-print("URL Scheme: recallsentry://")
-print("")
-print("Next: Add route handling in Flutter to parse deep link paths")
+def main():
+    with Journal('add_deep_links') as journal:
+        # ==== ANDROID ====
+        android_path = REPO_ROOT / 'android' / 'app' / 'src' / 'main' / 'AndroidManifest.xml'
+
+        with open(android_path, 'r', encoding='utf-8') as f:
+            android_content = f.read()
+
+        # Add deep link intent-filter to Android
+        if OLD_ANDROID in android_content:
+            android_content = android_content.replace(OLD_ANDROID, NEW_ANDROID)
+            journal.write_text(android_path, android_content)
+            print("[OK] Android: Added deep link intent-filter")
+        elif 'android:scheme="recallsentry"' in android_content:
+            print("[OK] Android: Deep links already configured")
+        else:
+            print("[ERROR] Android: Could not find expected pattern")
+
+        # ==== iOS ====
+        ios_path = REPO_ROOT / 'ios' / 'Runner' / 'Info.plist'
+
+        with open(ios_path, 'r', encoding='utf-8') as f:
+            ios_content = f.read()
+
+        # Add CFBundleURLTypes for iOS deep links
+        if 'CFBundleURLTypes' not in ios_content:
+            # Insert before closing </dict></plist>
+            ios_content = ios_content.replace('</dict>\n</plist>', IOS_URL_TYPES + '</dict>\n</plist>')
+            journal.write_text(ios_path, ios_content)
+            print("[OK] iOS: Added CFBundleURLTypes for deep links")
+        else:
+            print("[OK] iOS: CFBundleURLTypes already exists")
+
+
+    print("")
+    print("Deep link configuration complete!")
+    print("URL Scheme: recallsentry://")
+    print("")
+    print("Next: Add route handling in Flutter to parse deep link paths")
+
+if __name__ == '__main__':
+    main()
@@ -4,42 +4,45 @@ Simple script to add back buttons by adding the import and inserting
 a back button widget before the app icon in the header
 """
 
+import functools
 import re
-from pathlib import Path
+import sys
 
-def add_back_button(filepath):
-    """Add back button to a page file"""
+from add_back_buttons import back_button_import
+from codemod_journal import Journal
+from file_discovery import discover
+from result_sink import ResultSink, pop_results_option
+
+IMPORT_PATTERN = re.compile(r"(import '[^']+';)")
+# Row( children: [ GestureDetector (app icon)
+HEADER_PATTERN = re.compile(r'(Row\s*\(\s*children:\s*\[)\s*(//[^\n]*)?\s*(GestureDetector\s*\()')
+
+def add_back_button(filepath, journal):
+    """Add back button to a page file; return [(action, finding)]"""
     with open(filepath, 'r', encoding='utf-8') as f:
         content = f.read()
 
     # Skip if already has custom_back_button import
     if 'custom_back_button.dart' in content:
-        return False, "Already has back button import"
-
-    # Skip main navigation pages
-    if filepath.name in ['home_page.dart', 'main_navigation.dart']:
-        return False, "Main navigation page"
+        return [('skipped', "Already has back button import")]
 
     # Skip if no Scaffold
     if 'Scaffold' not in content:
-        return False, "No Scaffold"
+        return [('skipped', "No Scaffold")]
 
     # Add import after last import line
-    import_pattern = r"(import '[^']+';)"
-    imports = list(re.finditer(import_pattern, content))
+    imports = list(IMPORT_PATTERN.finditer(content))
     if imports:
         last_import = imports[-1]
         insert_pos = last_import.end()
         content = (content[:insert_pos] +
-                  "\nimport '../widgets/custom_back_button.dart';" +
+                  "\n" + back_button_import(filepath) +
                   content[insert_pos:])
 
     # Now add back button in header - look for the Row with app icon pattern
     # Pattern: Row( children: [ GestureDetector (app icon)
     # Insert CustomBackButton before the GestureDetector
 
-    header_pattern = r'(Row\s*\(\s*children:\s*\[)\s*(//[^\n]*)?\s*(GestureDetector\s*\()'
-
     def add_button(match):
         row_start = match.group(1)
         comment = match.group(2) or ''
@@ -56,40 +59,27 @@ def add_back_button(filepath):
                 f"                  const SizedBox(width: 8),\n"
                 f"                  {gesture}")
 
-    new_content = re.sub(header_pattern, add_button, content)
+    new_content = HEADER_PATTERN.sub(add_button, content)
 
     if new_content != content:
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(new_content)
-        return True, "Updated"
-
-    return False, "No matching pattern"
-
-def main():
-    pages_dir = Path('lib/pages')
-    dart_files = list(pages_dir.glob('*.dart'))
+        journal.write_text(filepath, new_content)
+        return [('updated', None)]
 
-    print("Adding back buttons to pages...\n")
+    return [('skipped', "No matching pattern")]
 
-    updated = []
-    skipped = []
+def main(argv=None):
+    results, args = pop_results_option(sys.argv[1:] if argv is None else argv)
+    if args:
+        print("Usage: python add_simple_back_buttons.py [--results PATH]")
+        return 2
 
-    for filepath in sorted(dart_files):
-        success, reason = add_back_button(filepath)
-        if success:
-            updated.append(filepath.name)
-            print(f"  SUCCESS: {filepath.name}")
-        else:
-            skipped.append((filepath.name, reason))
+    # Main navigation pages are excluded by the 'back-buttons' rule
+    dart_files = discover('back-buttons')
 
-    print(f"\n=== Summary ===")
-    print(f"Updated: {len(updated)} pages")
-    print(f"Skipped: {len(skipped)} pages")
+    print("Adding back buttons to pages...")
 
-    if updated:
-        print(f"\nUpdated pages:")
-        for name in updated:
-            print(f"  - {name}")
+    with Journal('add_simple_back_buttons') as journal, ResultSink('simple-back-buttons', results) as sink:
+        sink.run(functools.partial(add_back_button, journal=journal), dart_files)
 
 if __name__ == '__main__':
-    main()
+    sys.exit(main())
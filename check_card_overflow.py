@@ -1,85 +1,82 @@
 #!/usr/bin/env python3
 """
 Check Card widgets for potential overflow issues
+
+Usage:
+    python check_card_overflow.py [--jobs N] [--results PATH]
 """
 
 import re
-from pathlib import Path
+import sys
+
+from file_discovery import discover
+from result_sink import ResultSink, pop_results_option
+
+CARD_PATTERN = re.compile(r'Card\(')
+ROW_CHILDREN_PATTERN = re.compile(r'Row\([^)]*children:\s*\[')
 
 def check_card_for_overflow(filepath):
     """Check if Card widgets have proper constraints"""
+    with open(filepath, 'r', encoding='utf-8') as f:
+        content = f.read()
+
+    issues = []
+
+    # Find Card widgets
+    cards = CARD_PATTERN.finditer(content)
+
+    for match in cards:
+        # Get context around the Card
+        start = max(0, match.start() - 500)
+        end = min(len(content), match.end() + 1000)
+        context = content[start:end]
+
+        # Check for Row without Expanded/Flexible
+        if 'Row(' in context:
+            row_match = ROW_CHILDREN_PATTERN.search(context)
+            if row_match:
+                # Look ahead from Row to see if Text is wrapped
+                row_children = context[row_match.end():row_match.end()+500]
+                if 'Text(' in row_children and not ('Expanded(' in row_children or 'Flexible(' in row_children):
+                    # Check if it's in a child widget
+                    if 'child:' in row_children[:row_children.find('Text(')]:
+                        issues.append({
+                            'type': 'Row with unwrapped Text',
+                            'line': content[:match.start()].count('\n') + 1,
+                            'context': context[max(0, match.start()-start-50):match.end()-start+50]
+                        })
+
+    return issues
+
+def check_file(filepath):
+    """Check one file; return [(action, finding)] for the result sink"""
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        issues = []
-
-        # Find Card widgets
-        card_pattern = r'Card\('
-        cards = re.finditer(card_pattern, content)
-
-        for match in cards:
-            # Get context around the Card
-            start = max(0, match.start() - 500)
-            end = min(len(content), match.end() + 1000)
-            context = content[start:end]
-
-            # Check for Row without Expanded/Flexible
-            if 'Row(' in context:
-                row_match = re.search(r'Row\([^)]*children:\s*\[', context)
-                if row_match:
-                    # Look ahead from Row to see if Text is wrapped
-                    row_children = context[row_match.end():row_match.end()+500]
-                    if 'Text(' in row_children and not ('Expanded(' in row_children or 'Flexible(' in row_children):
-                        # Check if it's in a child widget
-                        if 'child:' in row_children[:row_children.find('Text(')]:
-                            issues.append({
-                                'type': 'Row with unwrapped Text',
-                                'line': content[:match.start()].count('\n') + 1,
-                                'context': context[max(0, match.start()-start-50):match.end()-start+50]
-                            })
-
-        return issues
-
+        issues = check_card_for_overflow(filepath)
     except Exception as e:
-        print(f"  ERROR: {filepath.name}: {e}")
-        return []
+        return [('error', str(e))]
+
+    if not issues:
+        return [('ok', None)]
+    return [('finding', f"Line {issue['line']}: {issue['type']}") for issue in issues]
+
+def main(argv=None):
+    results, args = pop_results_option(sys.argv[1:] if argv is None else argv)
+    # Sequential by default: for a few hundred files starting a process pool
+    # costs more than it saves, so workers are opt-in
+    jobs = 1
+    if args[:1] == ['--jobs'] and len(args) == 2 and args[1].isdigit() and int(args[1]) > 0:
+        jobs = int(args[1])
+    elif args:
+        print(__doc__.strip().split('Usage:')[1].strip())
+        return 2
 
-def main():
-    pages_dir = Path('lib/pages')
+    print("Checking Card widgets for overflow issues...")
 
-    if not pages_dir.exists():
-        print("Error: lib/pages directory not found")
-        return
+    dart_files = discover('overflow-check')
 
-    print("Checking Card widgets for overflow issues...")
-    print()
-
-    dart_files = [
-        'all_fda_recalls_page.dart',
-        'all_recalls_page.dart',
-        'all_usda_recalls_page.dart',
-        'filtered_recalls_page.dart',
-        'home_page.dart',
-        'info_page.dart',
-        'saved_recalls_page.dart',
-        'rmc_list_page.dart'
-    ]
-
-    total_issues = 0
-
-    for filename in dart_files:
-        filepath = pages_dir / filename
-        if filepath.exists():
-            issues = check_card_for_overflow(filepath)
-            if issues:
-                print(f"\n{filename}:")
-                for issue in issues:
-                    print(f"  Line {issue['line']}: {issue['type']}")
-                    total_issues += len(issues)
-
-    print()
-    print(f"Total potential issues: {total_issues}")
+    # Read-only check, so files can be spread across worker processes
+    with ResultSink('overflow-check', results) as sink:
+        sink.run(check_file, dart_files, jobs=jobs)
 
 if __name__ == '__main__':
-    main()
+    sys.exit(main())
@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""
+Reversible change journal for codemod scripts.
+
+Every run of a sweep (add_back_buttons.py, update_app_icons.py, ...) writes
+a journal of byte-range edits per file to .codemod_journal/<run-id>.jsonl.
+A run can then be undone or replayed onto another checkout by applying the
+recorded edits directly, without re-running any regex. Undo and replay
+report each file to a ResultSink (rules journal-undo / journal-replay).
+
+Usage:
+    python codemod_journal.py list
+    python codemod_journal.py show <run-id>
+    python codemod_journal.py undo <run-id> [--force] [--results PATH]
+    python codemod_journal.py replay <run-id> <checkout-root> [--force] [--results PATH]
+"""
+
+import hashlib
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+from file_discovery import REPO_ROOT
+from result_sink import ResultSink, pop_results_option
+
+JOURNAL_DIR = REPO_ROOT / '.codemod_journal'
+
+
+def _sha1(data):
+    """Return the hex SHA-1 of a bytes object"""
+    return hashlib.sha1(data).hexdigest()
+
+
+def _encode(data):
+    """Bytes -> JSON-safe str (latin-1 maps every byte to one code point)"""
+    return data.decode('latin-1')
+
+
+def _decode(text):
+    """Inverse of _encode"""
+    return text.encode('latin-1')
+
+
+def compute_edits(old, new):
+    """
+    Return a list of (offset, old_bytes, new_bytes) edits turning old into new.
+
+    Offsets refer to positions in `old`. The diff runs on lines so a sweep
+    that touches a few lines of a large file only stores those lines.
+    """
+    import difflib
+
+    old_lines = old.splitlines(keepends=True)
+    new_lines = new.splitlines(keepends=True)
+
+    # Byte offset of the start of every line (plus one past the end)
+    old_starts = [0]
+    for line in old_lines:
+        old_starts.append(old_starts[-1] + len(line))
+    new_starts = [0]
+    for line in new_lines:
+        new_starts.append(new_starts[-1] + len(line))
+
+    matcher = difflib.SequenceMatcher(None, old_lines, new_lines, autojunk=False)
+    edits = []
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == 'equal':
+            continue
+        edits.append((
+            old_starts[i1],
+            old[old_starts[i1]:old_starts[i2]],
+            new[new_starts[j1]:new_starts[j2]],
+        ))
+    return edits
+
+
+def apply_edits(data, edits):
+    """Apply (offset, old, new) edits to data, verifying the old bytes match"""
+    # Work from the end so earlier offsets stay valid
+    for offset, old, new in sorted(edits, key=lambda e: e[0], reverse=True):
+        if data[offset:offset + len(old)] != old:
+            raise ValueError(f"content at byte {offset} does not match journal")
+        data = data[:offset] + new + data[offset + len(old):]
+    return data
+
+
+def invert_edits(edits):
+    """Return edits that undo `edits`, with offsets in the edited file"""
+    inverted = []
+    shift = 0
+    for offset, old, new in sorted(edits, key=lambda e: e[0]):
+        inverted.append((offset + shift, new, old))
+        shift += len(new) - len(old)
+    return inverted
+
+
+class Journal:
+    """
+    Records the edits a codemod makes, one JSON line per changed file.
+
+    Use as a context manager and route file writes through write_text():
+
+        with Journal('add_back_buttons') as journal:
+            journal.write_text(filepath, content)
+    """
+
+    def __init__(self, script, journal_dir=JOURNAL_DIR, root=REPO_ROOT):
+        self.script = script
+        self.journal_dir = Path(journal_dir)
+        self.run_id = None
+        self.path = None
+        self.root = Path(root).resolve()
+        self.files_changed = set()
+        self._handle = None
+
+    def _new_run_id(self):
+        # Sub-second time plus pid, so back-to-back runs never share an id
+        now = time.time_ns()
+        stamp = time.strftime('%Y%m%d-%H%M%S', time.localtime(now // 10**9)) + f".{now % 10**9:09d}"
+        return f"{stamp}-{os.getpid()}-{self.script}"
+
+    def __enter__(self):
+        self.journal_dir.mkdir(parents=True, exist_ok=True)
+        while True:
+            self.run_id = self._new_run_id()
+            self.path = self.journal_dir / f"{self.run_id}.jsonl"
+            try:
+                # 'x' never truncates another run's journal
+                self._handle = open(self.path, 'x', encoding='utf-8')
+                break
+            except FileExistsError:
+                continue
+        self._write_line({
+            'run_id': self.run_id,
+            'script': self.script,
+            'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        })
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._handle.close()
+        self._handle = None
+        if not self.files_changed:
+            # Nothing to undo, don't leave an empty journal behind
+            self.path.unlink()
+        else:
+            print(f"Journal: {self.run_id} ({len(self.files_changed)} files)")
+        return False
+
+    def _write_line(self, record):
+        self._handle.write(json.dumps(record, separators=(',', ':')) + '\n')
+        # Flush per file so an interrupted run can still be undone
+        self._handle.flush()
+
+    def write_text(self, filepath, content):
+        """
+        Write content to filepath (as open(..., 'w') would) and journal it.
+
+        Writing the same file again adds another record whose 'before' hash
+        is the previous record's 'after' hash.
+        """
+        filepath = Path(filepath)
+        before = filepath.read_bytes() if filepath.exists() else b''
+
+        with open(filepath, 'w', encoding='utf-8') as f:
+            f.write(content)
+
+        after = filepath.read_bytes()
+        if after == before:
+            return
+
+        try:
+            rel_path = filepath.resolve().relative_to(self.root)
+        except ValueError:
+            rel_path = filepath.resolve()
+
+        self._write_line({
+            'path': rel_path.as_posix(),
+            'before': _sha1(before),
+            'after': _sha1(after),
+            'edits': [[offset, _encode(old), _encode(new)]
+                      for offset, old, new in compute_edits(before, after)],
+        })
+        self.files_changed.add(rel_path)
+
+
+def load_journal(run_id, journal_dir=JOURNAL_DIR):
+    """Return (header, file_records) for a run id"""
+    path = Path(journal_dir) / f"{run_id}.jsonl"
+    if not path.exists():
+        raise FileNotFoundError(f"No journal for run {run_id}")
+
+    with open(path, 'r', encoding='utf-8') as f:
+        lines = [json.loads(line) for line in f if line.strip()]
+
+    header, records = lines[0], lines[1:]
+    for record in records:
+        record['edits'] = [(offset, _decode(old), _decode(new))
+                           for offset, old, new in record['edits']]
+    return header, records
+
+
+def _file_count(records):
+    return len({record['path'] for record in records})
+
+
+def _apply_record(record, root, reverse, force):
+    """Apply (or revert) one file record under root; return (action, finding)"""
+    filepath = Path(root) / record['path']
+    expected = record['after'] if reverse else record['before']
+    edits = invert_edits(record['edits']) if reverse else record['edits']
+
+    if not filepath.exists():
+        return 'error', 'file not found'
+
+    data = filepath.read_bytes()
+    if _sha1(data) != expected and not force:
+        return 'skipped', 'modified since run'
+
+    try:
+        filepath.write_bytes(apply_edits(data, edits))
+    except ValueError as e:
+        return 'error', str(e)
+
+    return ('reverted' if reverse else 'applied'), None
+
+
+def _apply_run(records, root, reverse, force, results=None):
+    """Apply (or revert) every record under root, reporting each to a ResultSink"""
+    with ResultSink('journal-undo' if reverse else 'journal-replay', results) as sink:
+        sink.file_count = _file_count(records)
+        # A file written twice has two records; undo must revert the newest first
+        for record in reversed(records) if reverse else records:
+            sink.emit(record['path'], *_apply_record(record, root, reverse, force))
+
+    if sink.counts['skipped']:
+        print("Files modified since the run were skipped; use --force to apply anyway")
+
+
+def undo(run_id, force=False, journal_dir=JOURNAL_DIR, root=REPO_ROOT, results=None):
+    """Revert a run in this checkout"""
+    header, records = load_journal(run_id, journal_dir)
+    print(f"Undoing {header['run_id']} ({header['script']})...")
+    _apply_run(records, root, reverse=True, force=force, results=results)
+
+
+def replay(run_id, root, force=False, journal_dir=JOURNAL_DIR, results=None):
+    """Apply a run's edits onto another checkout"""
+    header, records = load_journal(run_id, journal_dir)
+    print(f"Replaying {header['run_id']} ({header['script']}) onto {root}...")
+    _apply_run(records, Path(root), reverse=False, force=force, results=results)
+
+
+def list_runs(journal_dir=JOURNAL_DIR):
+    """Print every recorded run, oldest first"""
+    journal_dir = Path(journal_dir)
+    runs = sorted(journal_dir.glob('*.jsonl')) if journal_dir.exists() else []
+    if not runs:
+        print("No codemod runs recorded")
+        return
+    for path in runs:
+        _, records = load_journal(path.stem, journal_dir)
+        print(f"  {path.stem}  ({_file_count(records)} files)")
+
+
+def show(run_id):
+    """Print the files and edit counts of a run"""
+    header, records = load_journal(run_id)
+    print(f"{header['run_id']} ({header['script']}, {header['created']})")
+    for record in records:
+        edit_bytes = sum(len(old) + len(new) for _, old, new in record['edits'])
+        print(f"  {record['path']}: {len(record['edits'])} edits, {edit_bytes} bytes")
+
+
+def main(argv=None):
+    results, args = pop_results_option(sys.argv[1:] if argv is None else argv)
+    force = '--force' in args
+    args = [a for a in args if a != '--force']
+
+    if not args or args[0] == 'list':
+        list_runs()
+    elif args[0] == 'show' and len(args) == 2:
+        show(args[1])
+    elif args[0] == 'undo' and len(args) == 2:
+        undo(args[1], force=force, results=results)
+    elif args[0] == 'replay' and len(args) == 3:
+        replay(args[1], args[2], force=force, results=results)
+    else:
+        print(__doc__.strip().split('Usage:')[1])
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,16 +1,66 @@
 #!/usr/bin/env python3
 """
-Convert Android Studio Setup Guide from Markdown to Word Document
+Convert a Markdown guide (by default the Android Studio Setup Guide) to a
+Word document
+
+Usage:
+    python docs/convert_to_word.py [guide.md] [output.docx] [--title TITLE]
 """
 
-from docx import Document
-from docx.shared import Pt, Inches, RGBColor
-from docx.enum.text import WD_ALIGN_PARAGRAPH
-from docx.enum.style import WD_STYLE_TYPE
 import re
+import sys
+from pathlib import Path
+
+# python-docx is only imported when a document is actually built, so other
+# tools (e.g. search_index.py) can reuse the Markdown parsing below without it.
+
+# Headings the converter understands: '# ' through '#### '
+HEADING_PATTERN = re.compile(r'^(#{1,4}) (.*)$')
+# Numbered list items: '1. ', '12.'
+NUMBERED_ITEM_PATTERN = re.compile(r'^\d+\.\s*')
+
+def parse_heading(line):
+    """Return (level, text) if line is a Markdown heading, else None"""
+    match = HEADING_PATTERN.match(line)
+    if match:
+        return len(match.group(1)), match.group(2)
+    return None
+
+DEFAULT_GUIDE = Path(__file__).resolve().parent / 'Android_Studio_Setup_Guide.md'
+
+def split_title(lines):
+    """
+    Return (title, subtitle, body_start) for a guide's title block.
+
+    Guides open with '# Title', optionally followed by a '## Subtitle' line
+    and a '---' rule; those become the title page instead of body content.
+    """
+    i = 0
+    while i < len(lines) and not lines[i].strip():
+        i += 1
+    heading = parse_heading(lines[i]) if i < len(lines) else None
+    if not heading or heading[0] != 1:
+        return None, None, 0
+
+    title, subtitle = heading[1].strip(), None
+    i += 1
+    heading = parse_heading(lines[i]) if i < len(lines) else None
+    if heading and heading[0] == 2:
+        subtitle = heading[1].strip()
+        i += 1
+
+    # Drop the blank lines and rule that close the title block
+    j = i
+    while j < len(lines) and not lines[j].strip():
+        j += 1
+    if j < len(lines) and lines[j].strip() == '---':
+        i = j + 1
+    return title, subtitle, i
 
 def add_heading(doc, text, level=1):
     """Add a heading with custom formatting"""
+    from docx.enum.text import WD_ALIGN_PARAGRAPH
+
     heading = doc.add_heading(text, level=level)
     heading.alignment = WD_ALIGN_PARAGRAPH.LEFT
     return heading
@@ -26,6 +76,8 @@ def add_paragraph(doc, text, style=None, bold=False, italic=False):
 
 def add_code_block(doc, code):
     """Add a code block with monospace font"""
+    from docx.shared import Pt
+
     p = doc.add_paragraph(code)
     p.style = 'Intense Quote'
     run = p.runs[0]
@@ -38,8 +90,11 @@ def add_bullet_list(doc, items):
     for item in items:
         doc.add_paragraph(item, style='List Bullet')
 
-def parse_markdown_to_word(md_file, output_file):
+def parse_markdown_to_word(md_file, output_file, title=None):
     """Parse markdown and create Word document"""
+    from docx import Document
+    from docx.shared import Pt, Inches, RGBColor
+    from docx.enum.text import WD_ALIGN_PARAGRAPH
 
     # Create document
     doc = Document()
@@ -52,14 +107,25 @@ def parse_markdown_to_word(md_file, output_file):
         section.left_margin = Inches(1)
         section.right_margin = Inches(1)
 
-    # Title Page
-    title = doc.add_heading('Android Studio Setup Guide for Flutter', 0)
-    title.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    # Read markdown file
+    with open(md_file, 'r', encoding='utf-8') as f:
+        content = f.read()
 
-    subtitle = doc.add_paragraph('RecallSentry Mobile App - Windows PC')
-    subtitle.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    subtitle.runs[0].font.size = Pt(16)
-    subtitle.runs[0].font.color.rgb = RGBColor(0, 0, 128)
+    # Split into lines
+    lines = content.split('\n')
+
+    # Title page comes from the guide's own title block (or --title)
+    md_title, md_subtitle, body_start = split_title(lines)
+    title = title or md_title or Path(md_file).stem.replace('_', ' ')
+
+    title_heading = doc.add_heading(title, 0)
+    title_heading.alignment = WD_ALIGN_PARAGRAPH.CENTER
+
+    if md_subtitle:
+        subtitle = doc.add_paragraph(md_subtitle)
+        subtitle.alignment = WD_ALIGN_PARAGRAPH.CENTER
+        subtitle.runs[0].font.size = Pt(16)
+        subtitle.runs[0].font.color.rgb = RGBColor(0, 0, 128)
 
     doc.add_paragraph()  # Blank line
 
@@ -74,27 +140,16 @@ def parse_markdown_to_word(md_file, output_file):
 
     doc.add_page_break()
 
-    # Read markdown file
-    with open(md_file, 'r', encoding='utf-8') as f:
-        content = f.read()
-
-    # Split into lines
-    lines = content.split('\n')
-
     in_code_block = False
     code_buffer = []
     in_list = False
     list_buffer = []
 
-    i = 0
+    # Title and subtitle are already on the title page
+    i = body_start
     while i < len(lines):
         line = lines[i]
 
-        # Skip title and subtitle (already added)
-        if i < 5:
-            i += 1
-            continue
-
         # Handle code blocks
         if line.strip().startswith('```'):
             if in_code_block:
@@ -121,38 +176,25 @@ def parse_markdown_to_word(md_file, output_file):
             continue
 
         # Handle headings
-        if line.startswith('# '):
+        heading = parse_heading(line)
+        if heading:
             if list_buffer:
                 add_bullet_list(doc, list_buffer)
                 list_buffer = []
-            add_heading(doc, line[2:], level=1)
-        elif line.startswith('## '):
-            if list_buffer:
-                add_bullet_list(doc, list_buffer)
-                list_buffer = []
-            add_heading(doc, line[3:], level=2)
-        elif line.startswith('### '):
-            if list_buffer:
-                add_bullet_list(doc, list_buffer)
-                list_buffer = []
-            add_heading(doc, line[4:], level=3)
-        elif line.startswith('#### '):
-            if list_buffer:
-                add_bullet_list(doc, list_buffer)
-                list_buffer = []
-            add_heading(doc, line[5:], level=4)
+            level, text = heading
+            add_heading(doc, text, level=level)
 
         # Handle bullet lists
         elif line.strip().startswith(('- ', '* ', '✓ ')):
             list_buffer.append(line.strip()[2:])
 
         # Handle numbered lists
-        elif re.match(r'^\d+\.', line.strip()):
+        elif NUMBERED_ITEM_PATTERN.match(line.strip()):
             if list_buffer:
                 add_bullet_list(doc, list_buffer)
                 list_buffer = []
             # Extract text after number
-            text = re.sub(r'^\d+\.\s*', '', line.strip())
+            text = NUMBERED_ITEM_PATTERN.sub('', line.strip())
             doc.add_paragraph(text, style='List Number')
 
         # Handle bold/italic text and regular paragraphs
@@ -188,8 +230,25 @@ def parse_markdown_to_word(md_file, output_file):
     doc.save(output_file)
     print(f"SUCCESS: Word document created: {output_file}")
 
-if __name__ == '__main__':
-    md_file = 'Android_Studio_Setup_Guide.md'
-    output_file = 'Android_Studio_Setup_Guide.docx'
+def main(argv=None):
+    args = list(sys.argv[1:] if argv is None else argv)
+    title = None
+    if '--title' in args:
+        i = args.index('--title')
+        if i + 1 >= len(args):
+            print(__doc__.strip().split('Usage:')[1].strip())
+            return 2
+        title = args[i + 1]
+        del args[i:i + 2]
+    if len(args) > 2:
+        print(__doc__.strip().split('Usage:')[1].strip())
+        return 2
+
+    md_file = args[0] if args else str(DEFAULT_GUIDE)
+    output_file = args[1] if len(args) > 1 else str(Path(md_file).with_suffix('.docx'))
+
+    parse_markdown_to_word(md_file, output_file, title=title)
+    return 0
 
-    parse_markdown_to_word(md_file, output_file)
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""
+Full-text search over the docs/ guides and lib/ Dart sources.
+
+Markdown files are split into sections by heading (using the same heading
+parsing as convert_to_word.py) and Dart files into top-level declarations.
+Terms are stored in an inverted index at .codemod_cache/search_index.json,
+which is updated incrementally: files are re-hashed only when their mtime or
+size changed, and re-tokenized only when their hash changed.
+
+Usage:
+    python docs/search_index.py build
+    python docs/search_index.py query <terms...> [-n 10] [--no-update]
+"""
+
+import hashlib
+import json
+import math
+import re
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from convert_to_word import parse_heading
+from file_discovery import REPO_ROOT, find_files
+
+INDEX_PATH = REPO_ROOT / '.codemod_cache' / 'search_index.json'
+INDEX_VERSION = 2
+
+SOURCES = ['docs/**/*.md', 'lib/**/*.dart']
+
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+
+WORD_PATTERN = re.compile(r'[A-Za-z_$][A-Za-z0-9_$]*|\d+')
+CAMEL_PATTERN = re.compile(r'[A-Z]+(?=[A-Z][a-z])|[A-Z]?[a-z]+|[A-Z]+|\d+')
+DART_DECLARATION_PATTERN = re.compile(
+    r'^(?:(?:abstract|base|final|sealed|interface)\s+)*'
+    r'(?:class|mixin|enum|extension|typedef)\s+(\w+)'
+)
+
+STOP_WORDS = {
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'if',
+    'in', 'is', 'it', 'of', 'on', 'or', 'the', 'this', 'to', 'with',
+}
+
+
+def tokenize(text):
+    """
+    Split text into lowercase search terms.
+
+    Identifiers are indexed whole and by their camelCase/snake_case parts,
+    so 'StoreKit' finds 'storeKitService' and 'recall_data'.
+    """
+    terms = []
+    for word in WORD_PATTERN.findall(text):
+        lower = word.lower()
+        if len(lower) > 1 and lower not in STOP_WORDS:
+            terms.append(lower)
+        parts = [p.lower() for chunk in word.split('_') for p in CAMEL_PATTERN.findall(chunk)]
+        if len(parts) > 1:
+            terms.extend(p for p in parts if len(p) > 1 and p not in STOP_WORDS and p != lower)
+    return terms
+
+
+def split_markdown(text):
+    """Return [(title, line_number, body), ...], one per heading section"""
+    sections = []
+    title, start, body = None, 1, []
+    in_code_block = False
+
+    for number, line in enumerate(text.split('\n'), 1):
+        if line.strip().startswith('```'):
+            in_code_block = not in_code_block
+        heading = None if in_code_block else parse_heading(line)
+        if heading:
+            if title is not None or any(l.strip() for l in body):
+                sections.append((title, start, '\n'.join(body)))
+            title, start, body = heading[1].strip(), number, []
+        body.append(line)
+
+    if title is not None or any(l.strip() for l in body):
+        sections.append((title, start, '\n'.join(body)))
+    return sections
+
+
+def split_dart(text):
+    """Return [(title, line_number, body), ...], one per top-level declaration"""
+    sections = []
+    title, start, body = None, 1, []
+
+    for number, line in enumerate(text.split('\n'), 1):
+        match = DART_DECLARATION_PATTERN.match(line)
+        if match:
+            if body:
+                sections.append((title, start, '\n'.join(body)))
+            title, start, body = match.group(1), number, []
+        body.append(line)
+
+    if body:
+        sections.append((title, start, '\n'.join(body)))
+    return sections
+
+
+def index_file(path, text):
+    """Return [[title, line, length, {term: tf}], ...] for one file"""
+    splitter = split_markdown if path.endswith('.md') else split_dart
+    sections = []
+    for title, line, body in splitter(text):
+        terms = tokenize(body)
+        if title:
+            # Headings and declaration names weigh more than body text
+            terms += tokenize(title) * 2
+        if terms:
+            sections.append([title or Path(path).name, line, len(terms), dict(Counter(terms))])
+    return sections
+
+
+def decode_postings(encoded):
+    """'id sec tf sec tf|id ...' -> {id: [sec, tf, sec, tf, ...]}"""
+    entries = {}
+    for chunk in encoded.split('|'):
+        file_key, *hits = chunk.split(' ')
+        entries[file_key] = [int(h) for h in hits]
+    return entries
+
+
+def encode_postings(entries):
+    """Inverse of decode_postings"""
+    return '|'.join(' '.join([file_key, *map(str, hits)]) for file_key, hits in entries.items())
+
+
+class SearchIndex:
+    """
+    Inverted index stored as compact JSON.
+
+    files:    path -> [file_id, mtime_ns, size, sha1, [[title, line, length], ...]]
+    postings: term -> 'file_id section tf section tf ...|file_id ...'
+
+    Postings stay encoded as strings until a term is queried or updated, so
+    loading the index only parses the term dictionary.
+    """
+
+    def __init__(self, path=INDEX_PATH):
+        self.path = Path(path)
+        self.files = {}
+        self.postings = {}
+        self.next_id = 0
+        self.dirty = False
+        if self.path.exists():
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if data.get('version') == INDEX_VERSION:
+                    self.files = data['files']
+                    self.postings = data['postings']
+                    self.next_id = data['next_id']
+            except (OSError, ValueError, KeyError):
+                pass
+
+    def _entries(self, term):
+        """Return the decoded postings for term (decoding on first use)"""
+        entries = self.postings.get(term)
+        if isinstance(entries, str):
+            entries = self.postings[term] = decode_postings(entries)
+        return entries
+
+    def _remove(self, path):
+        file_key = str(self.files.pop(path)[0])
+        needle = file_key + ' '
+        for term in list(self.postings):
+            encoded = self.postings[term]
+            # Cheap substring test before decoding (may give false positives)
+            if isinstance(encoded, str) and needle not in encoded:
+                continue
+            entries = self._entries(term)
+            if entries.pop(file_key, None) is not None and not entries:
+                del self.postings[term]
+        self.dirty = True
+
+    def _add(self, path, stat, digest, text):
+        file_id = self.next_id
+        self.next_id += 1
+        sections = index_file(path, text)
+        self.files[path] = [file_id, stat.st_mtime_ns, stat.st_size, digest,
+                            [section[:3] for section in sections]]
+        file_key = str(file_id)
+        for number, section in enumerate(sections):
+            for term, tf in section[3].items():
+                entries = self._entries(term)
+                if entries is None:
+                    entries = self.postings[term] = {}
+                entries.setdefault(file_key, []).extend((number, tf))
+        self.dirty = True
+
+    def update(self, root=REPO_ROOT):
+        """Bring the index in line with the tree; return (added, updated, removed)"""
+        added = updated = removed = 0
+        seen = set()
+
+        for filepath in find_files(SOURCES, root=root):
+            path = filepath.relative_to(root).as_posix()
+            seen.add(path)
+            stat = filepath.stat()
+            entry = self.files.get(path)
+            if entry and entry[1] == stat.st_mtime_ns and entry[2] == stat.st_size:
+                continue
+
+            data = filepath.read_bytes()
+            digest = hashlib.sha1(data).hexdigest()
+            if entry and entry[3] == digest:
+                # Touched but unchanged: just refresh the stat shortcut
+                entry[1], entry[2] = stat.st_mtime_ns, stat.st_size
+                self.dirty = True
+                continue
+
+            if entry:
+                self._remove(path)
+                updated += 1
+            else:
+                added += 1
+            self._add(path, stat, digest, data.decode('utf-8', errors='replace'))
+
+        for path in set(self.files) - seen:
+            self._remove(path)
+            removed += 1
+
+        return added, updated, removed
+
+    def save(self):
+        if not self.dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'version': INDEX_VERSION,
+                'next_id': self.next_id,
+                'files': self.files,
+                'postings': {
+                    term: entries if isinstance(entries, str) else encode_postings(entries)
+                    for term, entries in self.postings.items()
+                },
+            }, f, separators=(',', ':'))
+        self.dirty = False
+
+    def query(self, text, limit=10):
+        """Return [(score, path, line, title), ...] ranked by BM25"""
+        terms = set(tokenize(text))
+        if not terms or not self.files:
+            return []
+
+        by_id = {str(entry[0]): (path, entry[4]) for path, entry in self.files.items()}
+        section_count = sum(len(entry[4]) for entry in self.files.values())
+        average_length = sum(s[2] for entry in self.files.values() for s in entry[4]) / section_count
+
+        scores = Counter()
+        for term in terms:
+            entries = self._entries(term)
+            if not entries:
+                continue
+            df = sum(len(hits) // 2 for hits in entries.values())
+            idf = math.log(1 + (section_count - df + 0.5) / (df + 0.5))
+            for file_key, hits in entries.items():
+                sections = by_id[file_key][1]
+                for i in range(0, len(hits), 2):
+                    number, tf = hits[i], hits[i + 1]
+                    length = sections[number][2]
+                    norm = K1 * (1 - B + B * length / average_length)
+                    scores[(file_key, number)] += idf * tf * (K1 + 1) / (tf + norm)
+
+        results = []
+        for (file_key, number), score in scores.most_common(limit):
+            path, sections = by_id[file_key]
+            title, line, _ = sections[number]
+            results.append((score, path, line, title))
+        return results
+
+
+def main(argv=None):
+    args = list(sys.argv[1:] if argv is None else argv)
+    if not args or args[0] not in ('build', 'query'):
+        print(__doc__.strip().split('Usage:')[1])
+        return 1
+
+    limit = 10
+    if '-n' in args:
+        i = args.index('-n')
+        value = args[i + 1] if i + 1 < len(args) else ''
+        if not value.isdigit() or int(value) < 1:
+            print(__doc__.strip().split('Usage:')[1])
+            return 1
+        limit = int(value)
+        del args[i:i + 2]
+    no_update = '--no-update' in args
+    args = [a for a in args if a != '--no-update']
+
+    start = time.perf_counter()
+    index = SearchIndex()
+
+    if args[0] == 'build':
+        added, updated, removed = index.update()
+        index.save()
+        print(f"Indexed {len(index.files)} files, {len(index.postings)} terms "
+              f"({added} added, {updated} updated, {removed} removed) "
+              f"in {(time.perf_counter() - start) * 1000:.0f} ms")
+        return 0
+
+    if not no_update:
+        index.update()
+        index.save()
+
+    results = index.query(' '.join(args[1:]), limit=limit)
+    for score, path, line, title in results:
+        print(f"{score:6.2f}  {path}:{line}  {title}")
+    if not results:
+        print("No matches")
+    print(f"\n{len(results)} results in {(time.perf_counter() - start) * 1000:.0f} ms")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,98 @@
+"""Checks for incremental updates and ranking in the docs search index"""
+
+import os
+
+from search_index import SearchIndex, split_markdown, tokenize
+
+GUIDE = """# Setup Guide
+
+## Install Flutter
+
+Download the Flutter SDK.
+
+## Configure Firebase
+
+Add google-services.json to android/app.
+"""
+
+SERVICE = """import 'package:flutter/material.dart';
+
+class RecallService {
+  Future<void> fetchRecalls() async {}
+}
+"""
+
+
+def _write(root, path, content):
+    target = root / path
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_text(content)
+    # Bump the mtime explicitly so fast rewrites never look unchanged
+    stat = target.stat()
+    os.utime(target, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    return target
+
+
+def _index(tmp_path):
+    _write(tmp_path, 'docs/guide.md', GUIDE)
+    _write(tmp_path, 'lib/services/recall_service.dart', SERVICE)
+    index = SearchIndex(tmp_path / 'index.json')
+    assert index.update(root=tmp_path) == (2, 0, 0)
+    return index
+
+
+def _hits(index, text):
+    return [(path, title) for _, path, _, title in index.query(text)]
+
+
+def test_tokenize_splits_identifiers():
+    assert tokenize('storeKitService recall_data') == [
+        'storekitservice', 'store', 'kit', 'service', 'recall_data', 'recall', 'data',
+    ]
+
+
+def test_split_markdown_ignores_headings_in_code_blocks():
+    sections = split_markdown('# Title\n```\n# not a heading\n```\n## Next\n')
+    assert [(title, line) for title, line, _ in sections] == [('Title', 1), ('Next', 5)]
+
+
+def test_query_ranks_matching_section(tmp_path):
+    index = _index(tmp_path)
+    assert _hits(index, 'firebase')[0] == ('docs/guide.md', 'Configure Firebase')
+    assert _hits(index, 'recalls') == [('lib/services/recall_service.dart', 'RecallService')]
+
+
+def test_unchanged_files_are_not_reindexed(tmp_path):
+    index = _index(tmp_path)
+    _write(tmp_path, 'docs/guide.md', GUIDE)
+    assert index.update(root=tmp_path) == (0, 0, 0)
+
+
+def test_update_reindexes_changed_file(tmp_path):
+    index = _index(tmp_path)
+    _write(tmp_path, 'docs/guide.md', GUIDE.replace('Firebase', 'Supabase'))
+
+    assert index.update(root=tmp_path) == (0, 1, 0)
+    assert _hits(index, 'firebase') == []
+    assert _hits(index, 'supabase')[0] == ('docs/guide.md', 'Configure Supabase')
+
+
+def test_update_drops_removed_file(tmp_path):
+    index = _index(tmp_path)
+    (tmp_path / 'lib' / 'services' / 'recall_service.dart').unlink()
+
+    assert index.update(root=tmp_path) == (0, 0, 1)
+    assert _hits(index, 'recalls') == []
+    assert all(index._entries(term) for term in list(index.postings))
+
+
+def test_saved_index_reloads_and_updates(tmp_path):
+    index = _index(tmp_path)
+    index.save()
+
+    reloaded = SearchIndex(tmp_path / 'index.json')
+    assert _hits(reloaded, 'flutter')[0][0] == 'docs/guide.md'
+
+    _write(tmp_path, 'lib/services/recall_service.dart', SERVICE.replace('fetchRecalls', 'syncRecalls'))
+    assert reloaded.update(root=tmp_path) == (0, 1, 0)
+    assert _hits(reloaded, 'sync') == [('lib/services/recall_service.dart', 'RecallService')]
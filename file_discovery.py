@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""
+Shared file discovery for the repo maintenance scripts.
+
+Walks the tree with os.scandir, honours .gitignore files and per-rule
+include/exclude globs, and caches directory listings keyed on directory
+mtimes so repeated runs (and watch cycles) only re-list directories that
+actually changed.
+
+Usage:
+    python file_discovery.py [rule]     # print the files a rule selects
+"""
+
+import functools
+import json
+import os
+import re
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent
+CACHE_PATH = Path('.codemod_cache') / 'discovery.json'
+
+# Never worth walking, whatever .gitignore says
+ALWAYS_SKIPPED = {'.git', '.dart_tool', '.codemod_cache', '.codemod_journal'}
+
+GLOB_CHARS = frozenset('*?[')
+
+# Generated Dart sources are never edited by hand or by codemods
+GENERATED_FILES = ['**/*.g.dart', '**/*.freezed.dart', '**/*.mocks.dart']
+
+# File selection for each script. Globs are relative to the repo root;
+# '**/' matches any number of directories.
+RULES = {
+    'back-buttons': {
+        'include': ['lib/pages/**/*.dart', 'lib/modals/**/*.dart'],
+        'exclude': [
+            # Main navigation pages should NOT have back buttons
+            'lib/pages/home_page.dart',
+            'lib/pages/main_navigation.dart',
+        ],
+    },
+    'appbar-fix': {
+        'include': ['lib/pages/**/*.dart', 'lib/modals/**/*.dart'],
+        'exclude': [],
+    },
+    'icons': {
+        'include': ['lib/**/*.dart'],
+        'exclude': [],
+    },
+    'overflow-check': {
+        'include': ['lib/pages/**/*.dart', 'lib/widgets/**/*.dart', 'lib/modals/**/*.dart'],
+        'exclude': [],
+    },
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _glob_to_regex(pattern):
+    """Compile a path glob ('*', '?', '[..]', '**/') into a regex"""
+    i, out = 0, []
+    while i < len(pattern):
+        c = pattern[i]
+        if pattern.startswith('**/', i):
+            out.append('(?:.*/)?')
+            i += 3
+            continue
+        if pattern.startswith('**', i):
+            out.append('.*')
+            i += 2
+            continue
+        if c == '*':
+            out.append('[^/]*')
+        elif c == '?':
+            out.append('[^/]')
+        elif c == '[':
+            end = pattern.find(']', i + 1)
+            if end == -1:
+                out.append(re.escape(c))
+            else:
+                body = pattern[i + 1:end].replace('\\', '\\\\')
+                if body.startswith('!'):
+                    body = '^' + body[1:]
+                out.append(f'[{body}]')
+                i = end
+        else:
+            out.append(re.escape(c))
+        i += 1
+    return re.compile(''.join(out) + r'\Z')
+
+
+def glob_match(path, pattern):
+    """True if a posix relative path matches a glob"""
+    return _glob_to_regex(pattern).match(path) is not None
+
+
+def _compile_gitignore_pattern(line, prefix):
+    """
+    Return a (kind, value) matcher for one gitignore pattern.
+
+    Most lines are plain names, '*.ext' or anchored literal paths; those are
+    matched with string operations so only the rest pay for a regex compile.
+    """
+    if line.startswith('**/') and '/' not in line[3:]:
+        line = line[3:]  # '**/name' means the same as 'name'
+    if '/' in line.rstrip('/'):
+        # Anchored to the .gitignore's directory
+        pattern = prefix + line.lstrip('/')
+        if GLOB_CHARS.isdisjoint(pattern):
+            return 'path', pattern
+        return 'regex', _glob_to_regex(pattern)
+    # Matches the name at any depth below the .gitignore
+    if GLOB_CHARS.isdisjoint(line):
+        return 'name', line
+    if line.startswith('*') and GLOB_CHARS.isdisjoint(line[1:]):
+        return 'suffix', line[1:]
+    return 'regex', _glob_to_regex(prefix + '**/' + line)
+
+
+def parse_gitignore(text, base=''):
+    """
+    Parse .gitignore text into (kind, value, negated, dir_only) rules.
+
+    base is the posix path of the directory holding the .gitignore
+    ('' for the repo root); patterns are matched against repo-relative paths.
+    Rules only ever see paths below base, since walk() adds them on entering
+    that directory.
+    """
+    rules = []
+    prefix = base + '/' if base else ''
+    for line in text.splitlines():
+        line = line.rstrip()
+        if not line or line.startswith('#'):
+            continue
+        negated = line.startswith('!')
+        if negated:
+            line = line[1:]
+        dir_only = line.endswith('/')
+        line = line.rstrip('/')
+        if not line:
+            continue
+        kind, value = _compile_gitignore_pattern(line, prefix)
+        rules.append((kind, value, negated, dir_only))
+    return rules
+
+
+def is_ignored(rel_path, is_dir, rules):
+    """Apply gitignore rules in order; the last matching rule wins"""
+    ignored = False
+    name = rel_path.rsplit('/', 1)[-1]
+    for kind, value, negated, dir_only in rules:
+        if dir_only and not is_dir:
+            continue
+        if kind == 'name':
+            matched = name == value
+        elif kind == 'suffix':
+            matched = name.endswith(value)
+        elif kind == 'path':
+            matched = rel_path == value
+        else:
+            matched = value.match(rel_path) is not None
+        if matched:
+            ignored = not negated
+    return ignored
+
+
+class DiscoveryCache:
+    """Directory listings keyed on directory path and mtime"""
+
+    def __init__(self, path=CACHE_PATH):
+        self.path = Path(path)
+        self.entries = {}
+        self.dirty = False
+        if self.path.exists():
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    self.entries = json.load(f)
+            except (OSError, ValueError):
+                self.entries = {}
+
+    def listdir(self, dirpath):
+        """Return [(name, is_dir), ...] for dirpath, re-scanning only if it changed"""
+        key = os.fspath(dirpath)
+        mtime = os.stat(dirpath).st_mtime_ns
+        cached = self.entries.get(key)
+        if cached and cached[0] == mtime:
+            return cached[1]
+
+        with os.scandir(dirpath) as it:
+            listing = sorted((entry.name, entry.is_dir()) for entry in it)
+        self.entries[key] = [mtime, listing]
+        self.dirty = True
+        return listing
+
+    def save(self):
+        if not self.dirty:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, 'w', encoding='utf-8') as f:
+                json.dump(self.entries, f, separators=(',', ':'))
+            self.dirty = False
+        except OSError:
+            pass  # A read-only checkout just means no persistent cache
+
+
+# Shared across calls so watch loops keep the listings in memory
+_caches = {}
+
+
+def _get_cache(root):
+    root = Path(root).resolve()
+    if root not in _caches:
+        _caches[root] = DiscoveryCache(root / CACHE_PATH)
+    return _caches[root]
+
+
+def _literal_dir(pattern):
+    """Directory part of a glob before its first wildcard ('lib/pages/**/*.dart' -> 'lib/pages')"""
+    parts = []
+    for part in pattern.split('/')[:-1]:
+        if not GLOB_CHARS.isdisjoint(part):
+            break
+        parts.append(part)
+    return '/'.join(parts)
+
+
+def _wanted_dir(rel_path, dirs):
+    """True if rel_path is inside, or on the way to, one of dirs"""
+    return any(
+        not d or rel_path == d or rel_path.startswith(d + '/') or d.startswith(rel_path + '/')
+        for d in dirs
+    )
+
+
+def walk(root=REPO_ROOT, use_cache=True, dirs=None):
+    """
+    Return every non-ignored file under root as sorted posix relative paths.
+
+    dirs optionally limits the walk to those repo-relative directories (and
+    the directories leading to them).
+    """
+    root = Path(root)
+    cache = _get_cache(root) if use_cache else DiscoveryCache(os.devnull)
+    files = []
+
+    def visit(dirpath, rel_dir, rules):
+        listing = cache.listdir(dirpath)
+        names = {name for name, _ in listing}
+        if '.gitignore' in names:
+            with open(dirpath / '.gitignore', 'r', encoding='utf-8') as f:
+                rules = rules + parse_gitignore(f.read(), rel_dir)
+
+        for name, is_dir in listing:
+            rel_path = f'{rel_dir}/{name}' if rel_dir else name
+            if is_dir and name in ALWAYS_SKIPPED:
+                continue
+            if is_ignored(rel_path, is_dir, rules):
+                continue
+            if is_dir:
+                if dirs is None or _wanted_dir(rel_path, dirs):
+                    visit(dirpath / name, rel_path, rules)
+            else:
+                files.append(rel_path)
+
+    visit(root, '', [])
+    if use_cache:
+        cache.save()
+    return sorted(files)
+
+
+def find_files(include, exclude=(), root=REPO_ROOT, use_cache=True):
+    """Return Paths under root matching any include glob and no exclude glob"""
+    exclude = list(exclude) + GENERATED_FILES
+    # Only walk the directories the include globs can match in
+    dirs = {_literal_dir(pattern) for pattern in include}
+    return [
+        Path(root) / rel_path
+        for rel_path in walk(root, use_cache=use_cache, dirs=dirs)
+        if any(glob_match(rel_path, p) for p in include)
+        and not any(glob_match(rel_path, p) for p in exclude)
+    ]
+
+
+def discover(rule, root=REPO_ROOT, use_cache=True):
+    """Return the files selected by a named rule in RULES"""
+    config = RULES[rule]
+    return find_files(config['include'], config['exclude'], root=root, use_cache=use_cache)
+
+
+def main(argv=None):
+    args = sys.argv[1:] if argv is None else argv
+    if args and args[0] not in RULES:
+        print(f"Unknown rule: {args[0]} (choose from {', '.join(RULES)})")
+        return 1
+
+    if args:
+        paths = [path.relative_to(REPO_ROOT).as_posix() for path in discover(args[0])]
+    else:
+        paths = walk()
+    for path in paths:
+        print(path)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
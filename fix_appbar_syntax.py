@@ -3,9 +3,19 @@
 Fix AppBar syntax errors caused by automated back button insertion
 """
 
-import os
+import functools
 import re
-from pathlib import Path
+import sys
+
+from codemod_journal import Journal
+from file_discovery import discover
+from result_sink import ResultSink, pop_results_option
+
+# Leading inserted after backgroundColor, leaving the AppBar's ')' misplaced
+MISPLACED_LEADING_PATTERN = re.compile(
+    r'(backgroundColor:\s*const\s*Color\([^)]+\))\s*\n\s*(leading:\s*const\s*CustomBackButton\(\),),([^\n]*)'
+)
+DOUBLE_COMMA_PATTERN = re.compile(r',\),\s*\n\s*(leading:)')
 
 def fix_appbar_syntax(content):
     """Fix malformed AppBar with leading parameter"""
@@ -15,18 +25,17 @@ def fix_appbar_syntax(content):
     # leading: const CustomBackButton(),
 
     # Fix pattern where leading is inserted incorrectly
-    pattern = r'(backgroundColor:\s*const\s*Color\([^)]+\))\s*\n\s*(leading:\s*const\s*CustomBackButton\(\),),([^\n]*)'
     replacement = r'),\n      \2\n      \1\3'
 
-    content = re.sub(pattern, replacement, content)
+    content = MISPLACED_LEADING_PATTERN.sub(replacement, content)
 
     # Another pattern: fix double commas and misplaced closing parens
-    content = re.sub(r',\),\s*\n\s*(leading:)', r',\n      \1', content)
+    content = DOUBLE_COMMA_PATTERN.sub(r',\n      \1', content)
 
     return content
 
-def process_file(filepath):
-    """Process a single Dart file"""
+def process_file(filepath, journal):
+    """Process a single Dart file; return [(action, finding)]"""
     try:
         with open(filepath, 'r', encoding='utf-8') as f:
             content = f.read()
@@ -35,29 +44,26 @@ def process_file(filepath):
         content = fix_appbar_syntax(content)
 
         if content != original_content:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(content)
-            print(f"  Fixed: {filepath.name}")
-            return True
+            journal.write_text(filepath, content)
+            return [('fixed', None)]
         else:
-            return False
+            return [('skipped', None)]
 
     except Exception as e:
-        print(f"  ERROR: {filepath.name}: {e}")
-        return False
+        return [('error', str(e))]
 
-def main():
-    pages_dir = Path('lib/pages')
-    dart_files = list(pages_dir.glob('*.dart'))
+def main(argv=None):
+    results, args = pop_results_option(sys.argv[1:] if argv is None else argv)
+    if args:
+        print("Usage: python fix_appbar_syntax.py [--results PATH]")
+        return 2
 
-    print("Fixing AppBar syntax errors...")
-    fixed_count = 0
+    dart_files = discover('appbar-fix')
 
-    for filepath in sorted(dart_files):
-        if process_file(filepath):
-            fixed_count += 1
+    print("Fixing AppBar syntax errors...")
 
-    print(f"\nFixed {fixed_count} files")
+    with Journal('fix_appbar_syntax') as journal, ResultSink('appbar-fix', results) as sink:
+        sink.run(functools.partial(process_file, journal=journal), dart_files)
 
 if __name__ == '__main__':
-    main()
+    sys.exit(main())
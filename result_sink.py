@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Machine-readable results for the repo maintenance scripts.
+
+Scripts report one typed record per file outcome (file, rule, action,
+duration, finding) to a ResultSink instead of print()-ing a line per file.
+Records are buffered and streamed as JSONL by a single writer, even when
+files are processed in a worker pool, and a short human summary is printed
+at the end of the run.
+
+Results land in .codemod_cache/results/<rule>.jsonl, which the next run of
+the rule overwrites. Every script (and rs-tools command) that reports results
+accepts --results PATH to write elsewhere, so CI can keep one run's file and
+diff it against a later one:
+
+    rs-tools overflow-check --results old.jsonl
+    ...
+    rs-tools overflow-check --results new.jsonl
+    rs-tools results diff old.jsonl new.jsonl
+
+Usage:
+    python result_sink.py summary <results.jsonl>
+    python result_sink.py diff <old.jsonl> <new.jsonl>
+"""
+
+import json
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+from file_discovery import REPO_ROOT
+
+RESULTS_DIR = REPO_ROOT / '.codemod_cache' / 'results'
+
+# Records are written in batches so large runs don't block on file I/O
+FLUSH_EVERY = 256
+
+
+def _timed_call(args):
+    """Run func(filepath) and return (filepath, outcomes, duration_ms); used by pool workers"""
+    func, filepath = args
+    start = time.perf_counter()
+    try:
+        outcomes = func(filepath)
+    except Exception as e:
+        outcomes = [('error', str(e))]
+    return filepath, outcomes, (time.perf_counter() - start) * 1000
+
+
+class ResultSink:
+    """
+    Collects result records for one run of a rule and streams them as JSONL.
+
+    Use as a context manager; either emit() records directly or let run()
+    call a per-file function that returns [(action, finding), ...]:
+
+        with ResultSink('back-buttons') as sink:
+            sink.run(process_file, dart_files)
+    """
+
+    def __init__(self, rule, path=None):
+        self.rule = rule
+        self.path = Path(path) if path else RESULTS_DIR / f"{rule}.jsonl"
+        self.counts = Counter()
+        self.findings = []
+        self.file_count = 0
+        self._buffer = []
+        self._handle = None
+        self._start = None
+
+    def __enter__(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._handle = open(self.path, 'w', encoding='utf-8')
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.flush()
+        self._handle.close()
+        self._handle = None
+        if exc_type is None:
+            self.render_summary()
+        return False
+
+    def emit(self, file, action, finding=None, duration_ms=None):
+        """Record one outcome for a file"""
+        file = Path(file)
+        if file.is_absolute() and file.is_relative_to(REPO_ROOT):
+            # Repo-relative, so results from different checkouts can be diffed
+            file = file.relative_to(REPO_ROOT)
+        record = {
+            'file': file.as_posix(),
+            'rule': self.rule,
+            'action': action,
+            'duration_ms': round(duration_ms, 3) if duration_ms is not None else None,
+            'finding': finding,
+        }
+        self.counts[action] += 1
+        if action != 'skipped' and finding:
+            self.findings.append(record)
+        self._buffer.append(json.dumps(record, separators=(',', ':')))
+        if len(self._buffer) >= FLUSH_EVERY:
+            self.flush()
+
+    def flush(self):
+        if self._buffer:
+            self._handle.write('\n'.join(self._buffer) + '\n')
+            self._buffer = []
+
+    def run(self, func, files, jobs=1):
+        """
+        Call func(filepath) -> [(action, finding), ...] for every file.
+
+        With jobs > 1 files are processed in a process pool (func must then be
+        a module-level function); this process stays the only writer.
+        """
+        files = list(files)
+        self.file_count += len(files)
+        tasks = [(func, filepath) for filepath in files]
+
+        if jobs > 1 and len(files) > 1:
+            # Imported here so sequential runs don't pay for multiprocessing
+            from multiprocessing import Pool
+
+            with Pool(jobs) as pool:
+                results = pool.imap_unordered(_timed_call, tasks, chunksize=8)
+                for filepath, outcomes, duration_ms in results:
+                    self._emit_outcomes(filepath, outcomes, duration_ms)
+        else:
+            for task in tasks:
+                self._emit_outcomes(*_timed_call(task))
+
+    def _emit_outcomes(self, filepath, outcomes, duration_ms):
+        for action, finding in outcomes:
+            self.emit(filepath, action, finding, duration_ms)
+
+    def render_summary(self):
+        """Print a short human-readable summary of the run"""
+        elapsed = time.perf_counter() - self._start
+        print_summary(self.rule, self.findings, self.counts, self.file_count, elapsed)
+        try:
+            shown = self.path.relative_to(REPO_ROOT)
+        except ValueError:
+            shown = self.path
+        print(f"Results: {shown.as_posix()}")
+
+
+def pop_results_option(args):
+    """
+    Remove '--results PATH' from a script's arguments.
+
+    Returns (path or None, remaining args). A '--results' without a value is
+    left in the remaining args so the caller reports it as a usage error.
+    """
+    args = list(args)
+    if '--results' in args:
+        i = args.index('--results')
+        if i + 1 < len(args):
+            path = args[i + 1]
+            del args[i:i + 2]
+            return path, args
+    return None, args
+
+
+def print_summary(rule, findings, counts, file_count=None, elapsed=None):
+    """Print findings grouped by file, then totals per action"""
+    current = None
+    for record in sorted(findings, key=lambda r: r['file']):
+        if record['file'] != current:
+            current = record['file']
+            print(f"\n{current}:")
+        print(f"  [{record['action']}] {record['finding']}")
+
+    totals = ', '.join(f"{action}: {count}" for action, count in sorted(counts.items()))
+    files = f" across {file_count} files" if file_count is not None else ''
+    timing = f" in {elapsed:.2f}s" if elapsed is not None else ''
+    print(f"\n=== {rule} ===")
+    print(f"{totals or 'no results'}{files}{timing}")
+
+
+def load_results(path):
+    """Read a results file back into a list of records"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def _result_key(record):
+    # Everything except timing, which differs between every run
+    return (record['file'], record['rule'], record['action'], record['finding'] or '')
+
+
+def diff_results(old_records, new_records):
+    """Return (removed, added) records, ignoring durations and ordering"""
+    old = Counter(_result_key(r) for r in old_records)
+    new = Counter(_result_key(r) for r in new_records)
+    return sorted((old - new).elements()), sorted((new - old).elements())
+
+
+def main(argv=None):
+    args = sys.argv[1:] if argv is None else argv
+
+    if len(args) == 2 and args[0] == 'summary':
+        records = load_results(args[1])
+        rules = sorted({r['rule'] for r in records})
+        findings = [r for r in records if r['action'] != 'skipped' and r['finding']]
+        print_summary(', '.join(rules), findings, Counter(r['action'] for r in records),
+                      len({r['file'] for r in records}))
+        return 0
+
+    if len(args) == 3 and args[0] == 'diff':
+        removed, added = diff_results(load_results(args[1]), load_results(args[2]))
+        for file, rule, action, finding in removed:
+            print(f"- {file} [{rule}] {action} {finding}".rstrip())
+        for file, rule, action, finding in added:
+            print(f"+ {file} [{rule}] {action} {finding}".rstrip())
+        # Non-zero exit lets CI fail on changed results
+        return 1 if removed or added else 0
+
+    print(__doc__.strip().split('Usage:')[1])
+    return 2
+
+
+if __name__ == '__main__':
+    sys.exit(main())
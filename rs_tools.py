@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Single entry point for the repo maintenance scripts.
+
+Only this module and the one handling the chosen subcommand are imported,
+so a simple check starts quickly enough for pre-commit hooks and watch loops.
+Heavy dependencies (python-docx, multiprocessing) load only when used.
+
+Usage:
+    rs-tools <command> [args...]        (or: python rs_tools.py ...)
+"""
+
+import os
+import sys
+from importlib import import_module
+
+# os.path rather than pathlib: one less import on the startup path
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# command -> (module, function, passes arguments, help)
+COMMANDS = {
+    'back-buttons': ('add_back_buttons', 'main', True, "Add back buttons to pages [--results PATH]"),
+    'back-buttons-simple': ('add_simple_back_buttons', 'main', True, "Add back buttons before the header app icon [--results PATH]"),
+    'appbar-fix': ('fix_appbar_syntax', 'main', True, "Fix AppBars broken by back-button insertion [--results PATH]"),
+    'icons': ('update_app_icons', 'main', True, "Point app icon references at shield_logo3.png [--results PATH]"),
+    'overflow-check': ('check_card_overflow', 'main', True, "Check Card widgets for overflow issues [--jobs N] [--results PATH]"),
+    'deep-links': ('add_deep_links', 'main', False, "Add deep link config to Android and iOS"),
+    'app-links': ('add_app_links', 'main', False, "Add the app_links package to pubspec.yaml"),
+    'docs': (None, None, True, "docs convert [md] [docx] [--title T] | docs index | docs search <terms...>"),
+    'files': ('file_discovery', 'main', True, "List the files a discovery rule selects"),
+    'journal': ('codemod_journal', 'main', True, "List, undo or replay codemod runs"),
+    'results': ('result_sink', 'main', True, "Summarize or diff result files"),
+}
+
+# docs subcommand -> (module in docs/, function, argument prefix)
+DOCS_COMMANDS = {
+    'convert': ('convert_to_word', 'main', []),
+    'index': ('search_index', 'main', ['build']),
+    'search': ('search_index', 'main', ['query']),
+}
+
+
+def print_usage():
+    print(__doc__.strip().split('Usage:')[1].strip())
+    print("\nCommands:")
+    for name, (_, _, _, help_text) in COMMANDS.items():
+        print(f"  {name:<20} {help_text}")
+
+
+def run_docs(args):
+    if not args or args[0] not in DOCS_COMMANDS:
+        print(f"Usage: rs-tools docs {{{'|'.join(DOCS_COMMANDS)}}} [args...]")
+        return 2
+
+    module_name, func_name, prefix = DOCS_COMMANDS[args[0]]
+    sys.path.insert(0, os.path.join(ROOT, 'docs'))
+    func = getattr(import_module(module_name), func_name)
+    return func(prefix + args[1:])
+
+
+def main(argv=None):
+    args = sys.argv[1:] if argv is None else argv
+    if not args or args[0] in ('-h', '--help', 'help'):
+        print_usage()
+        return 0 if args else 2
+
+    command, args = args[0], args[1:]
+    if command not in COMMANDS:
+        print(f"Unknown command: {command}\n")
+        print_usage()
+        return 2
+
+    if command == 'docs':
+        return run_docs(args) or 0
+
+    module_name, func_name, passes_args, _ = COMMANDS[command]
+    if args and not passes_args:
+        print(f"{command} takes no arguments")
+        return 2
+
+    # Scripts live next to this file; make them importable from any cwd
+    sys.path.insert(0, ROOT)
+    func = getattr(import_module(module_name), func_name)
+    return (func(args) if passes_args else func()) or 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,95 @@
+"""Checks for the back-button codemods on files outside lib/pages/"""
+
+import add_back_buttons
+import add_simple_back_buttons
+from codemod_journal import Journal
+from file_discovery import REPO_ROOT
+
+PAGE_WITH_APPBAR = """import 'package:flutter/material.dart';
+
+class NestedPage extends StatelessWidget {
+  @override
+  Widget build(BuildContext context) {
+    return Scaffold(
+      appBar: AppBar(title: const Text('Nested')),
+    );
+  }
+}
+"""
+
+PAGE_WITH_HEADER_ROW = """import 'package:flutter/material.dart';
+
+class NestedPage extends StatelessWidget {
+  @override
+  Widget build(BuildContext context) {
+    return Scaffold(
+      body: Row(
+        children: [
+          GestureDetector(onTap: () {}),
+        ],
+      ),
+    );
+  }
+}
+"""
+
+MODAL_WITHOUT_APPBAR = """import 'package:flutter/material.dart';
+
+class Modal extends StatelessWidget {
+  @override
+  Widget build(BuildContext context) {
+    return Scaffold(body: const Text('modal'));
+  }
+}
+"""
+
+
+def _tree(tmp_path, monkeypatch, relative_path, content):
+    """Lay out lib/widgets/custom_back_button.dart plus one page in tmp_path"""
+    widget = tmp_path / 'lib' / 'widgets' / 'custom_back_button.dart'
+    widget.parent.mkdir(parents=True)
+    widget.write_text('')
+    monkeypatch.setattr(add_back_buttons, 'BACK_BUTTON_WIDGET', widget)
+
+    page = tmp_path / relative_path
+    page.parent.mkdir(parents=True, exist_ok=True)
+    page.write_text(content)
+    return page
+
+
+def test_import_follows_file_depth():
+    assert (add_back_buttons.back_button_import(REPO_ROOT / 'lib' / 'pages' / 'info_page.dart')
+            == "import '../widgets/custom_back_button.dart';")
+    assert (add_back_buttons.back_button_import(REPO_ROOT / 'lib' / 'pages' / 'widgets' / 'dialog.dart')
+            == "import '../../widgets/custom_back_button.dart';")
+
+
+def test_sweep_over_nested_file(tmp_path, monkeypatch):
+    page = _tree(tmp_path, monkeypatch, 'lib/pages/widgets/nested_page.dart', PAGE_WITH_APPBAR)
+
+    with Journal('test', journal_dir=tmp_path / '.codemod_journal') as journal:
+        assert add_back_buttons.process_file(page, journal) == [('updated', None)]
+
+    content = page.read_text()
+    assert "import '../../widgets/custom_back_button.dart';" in content
+    assert 'leading: const CustomBackButton()' in content
+
+
+def test_simple_sweep_over_nested_file(tmp_path, monkeypatch):
+    page = _tree(tmp_path, monkeypatch, 'lib/pages/widgets/nested_page.dart', PAGE_WITH_HEADER_ROW)
+
+    with Journal('test', journal_dir=tmp_path / '.codemod_journal') as journal:
+        assert add_simple_back_buttons.add_back_button(page, journal) == [('updated', None)]
+
+    content = page.read_text()
+    assert "import '../../widgets/custom_back_button.dart';" in content
+    assert 'const CustomBackButton()' in content
+
+
+def test_no_import_without_button(tmp_path, monkeypatch):
+    page = _tree(tmp_path, monkeypatch, 'lib/modals/modal.dart', MODAL_WITHOUT_APPBAR)
+
+    with Journal('test', journal_dir=tmp_path / '.codemod_journal') as journal:
+        assert add_back_buttons.process_file(page, journal) == [('skipped', 'no changes')]
+
+    assert page.read_text() == MODAL_WITHOUT_APPBAR
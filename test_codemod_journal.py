@@ -0,0 +1,89 @@
+"""Round-trip checks for the codemod change journal"""
+
+import pytest
+
+import result_sink
+from codemod_journal import Journal, apply_edits, compute_edits, invert_edits, load_journal, replay, undo
+from result_sink import load_results
+
+ORIGINAL = 'one\ntwo\nthree\n'
+
+
+@pytest.fixture(autouse=True)
+def results_dir(tmp_path, monkeypatch):
+    """Keep undo/replay results out of the repo's .codemod_cache"""
+    monkeypatch.setattr(result_sink, 'RESULTS_DIR', tmp_path / 'results')
+    return tmp_path / 'results'
+
+
+def _run(tmp_path, writes):
+    """Write each content to lib/page.dart in turn under one journal; return the Journal"""
+    page = tmp_path / 'lib' / 'page.dart'
+    page.parent.mkdir(parents=True, exist_ok=True)
+    page.write_text(ORIGINAL)
+    with Journal('test', journal_dir=tmp_path / 'journal', root=tmp_path) as journal:
+        for content in writes:
+            journal.write_text(page, content)
+    return journal
+
+
+@pytest.mark.parametrize('old, new', [
+    (b'', b'a\nb\n'),
+    (b'a\nb\nc\n', b'a\nc\n'),
+    (b'a\nb\nc\n', b'x\na\nb\nc\ny\n'),
+    (b'a\r\nb', b'a\r\nB\r\nb'),
+    ('café\n'.encode(), 'café\nnaïve\n'.encode()),
+])
+def test_edits_round_trip(old, new):
+    edits = compute_edits(old, new)
+    assert apply_edits(old, edits) == new
+    assert apply_edits(new, invert_edits(edits)) == old
+
+
+def test_apply_edits_rejects_mismatched_content():
+    edits = compute_edits(b'a\nb\n', b'a\nB\n')
+    with pytest.raises(ValueError):
+        apply_edits(b'a\nc\n', edits)
+
+
+def test_undo_file_written_twice(tmp_path, capsys, results_dir):
+    journal = _run(tmp_path, ['one\nTWO\nthree\n', 'ONE\nTWO\nthree\n'])
+    assert capsys.readouterr().out.strip() == f"Journal: {journal.run_id} (1 files)"
+
+    undo(journal.run_id, journal_dir=tmp_path / 'journal', root=tmp_path)
+    assert (tmp_path / 'lib' / 'page.dart').read_text() == ORIGINAL
+    records = load_results(results_dir / 'journal-undo.jsonl')
+    assert [(r['file'], r['action']) for r in records] == [('lib/page.dart', 'reverted')] * 2
+
+
+def test_replay_file_written_twice(tmp_path):
+    journal = _run(tmp_path, ['one\nTWO\nthree\n', 'ONE\nTWO\nthree\n'])
+
+    checkout = tmp_path / 'checkout'
+    (checkout / 'lib').mkdir(parents=True)
+    (checkout / 'lib' / 'page.dart').write_text(ORIGINAL)
+    replay(journal.run_id, checkout, journal_dir=tmp_path / 'journal')
+    assert (checkout / 'lib' / 'page.dart').read_text() == 'ONE\nTWO\nthree\n'
+
+
+def test_undo_skips_file_modified_since_run(tmp_path, results_dir):
+    journal = _run(tmp_path, ['one\nTWO\nthree\n'])
+    page = tmp_path / 'lib' / 'page.dart'
+    page.write_text('edited by hand\n')
+
+    undo(journal.run_id, journal_dir=tmp_path / 'journal', root=tmp_path)
+    assert page.read_text() == 'edited by hand\n'
+    [record] = load_results(results_dir / 'journal-undo.jsonl')
+    assert (record['action'], record['finding']) == ('skipped', 'modified since run')
+
+
+def test_records_are_repo_relative(tmp_path):
+    journal = _run(tmp_path, ['one\nTWO\nthree\n'])
+    header, records = load_journal(journal.run_id, tmp_path / 'journal')
+    assert header['script'] == 'test'
+    assert [record['path'] for record in records] == ['lib/page.dart']
+
+
+def test_unchanged_run_leaves_no_journal(tmp_path):
+    _run(tmp_path, [ORIGINAL])
+    assert list((tmp_path / 'journal').iterdir()) == []
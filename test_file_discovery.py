@@ -0,0 +1,112 @@
+"""Checks for gitignore handling and glob selection in file discovery"""
+
+import pytest
+
+from file_discovery import find_files, glob_match, is_ignored, parse_gitignore, walk
+
+
+def _ignored(text, path, is_dir=False, base=''):
+    return is_ignored(path, is_dir, parse_gitignore(text, base))
+
+
+@pytest.mark.parametrize('path, pattern, expected', [
+    ('lib/pages/home_page.dart', 'lib/pages/**/*.dart', True),
+    ('lib/pages/widgets/dialog.dart', 'lib/pages/**/*.dart', True),
+    ('lib/pages/home_page.dart', 'lib/pages/*.dart', True),
+    ('lib/pages/widgets/dialog.dart', 'lib/pages/*.dart', False),
+    ('lib/models/user.g.dart', '**/*.g.dart', True),
+    ('lib/pages_old/page.dart', 'lib/pages/**/*.dart', False),
+    ('lib/a1.dart', 'lib/a[0-9].dart', True),
+    ('lib/ab.dart', 'lib/a[!b].dart', False),
+])
+def test_glob_match(path, pattern, expected):
+    assert glob_match(path, pattern) is expected
+
+
+def test_name_matches_at_any_depth():
+    assert _ignored('build', 'build', is_dir=True)
+    assert _ignored('build', 'android/app/build', is_dir=True)
+    assert _ignored('*.log', 'logs/debug.log')
+    assert not _ignored('*.log', 'debug.log.txt')
+
+
+def test_anchored_patterns():
+    assert _ignored('/build', 'build', is_dir=True)
+    assert not _ignored('/build', 'android/build', is_dir=True)
+    assert _ignored('doc/*.txt', 'doc/notes.txt')
+    assert not _ignored('doc/*.txt', 'doc/server/notes.txt')
+    assert not _ignored('doc/*.txt', 'other/doc/notes.txt')
+
+
+def test_dir_only_patterns():
+    assert _ignored('build/', 'build', is_dir=True)
+    assert not _ignored('build/', 'build', is_dir=False)
+
+
+def test_negation_and_last_match_wins():
+    rules = '*.dart\n!keep.dart\n'
+    assert _ignored(rules, 'lib/drop.dart')
+    assert not _ignored(rules, 'lib/keep.dart')
+    assert _ignored(rules + 'keep.dart\n', 'lib/keep.dart')
+
+
+def test_comments_and_blank_lines():
+    assert parse_gitignore('# comment\n\n   \n') == []
+
+
+def test_nested_gitignore_is_relative_to_its_directory():
+    assert _ignored('/generated', 'lib/generated', is_dir=True, base='lib')
+    assert not _ignored('/generated', 'generated', is_dir=True, base='lib')
+    assert _ignored('out/*.json', 'lib/out/a.json', base='lib')
+
+
+def _write(root, files):
+    for path, content in files.items():
+        target = root / path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(content)
+
+
+def test_walk_honours_nested_gitignore(tmp_path):
+    _write(tmp_path, {
+        '.gitignore': 'build/\n*.log\n',
+        'lib/.gitignore': '/generated\n!important.log\n',
+        'lib/main.dart': '',
+        'lib/important.log': '',
+        'lib/debug.log': '',
+        'lib/generated/out.dart': '',
+        'lib/pages/generated/page.dart': '',
+        'build/app.dart': '',
+        '.git/HEAD': '',
+    })
+    assert walk(tmp_path, use_cache=False) == [
+        '.gitignore',
+        'lib/.gitignore',
+        'lib/important.log',
+        'lib/main.dart',
+        'lib/pages/generated/page.dart',
+    ]
+
+
+def test_find_files_applies_include_exclude_and_generated(tmp_path):
+    _write(tmp_path, {
+        'lib/pages/home_page.dart': '',
+        'lib/pages/info_page.dart': '',
+        'lib/pages/widgets/dialog.dart': '',
+        'lib/pages/info_page.g.dart': '',
+        'lib/services/api.dart': '',
+    })
+    found = find_files(['lib/pages/**/*.dart'], ['lib/pages/home_page.dart'], root=tmp_path, use_cache=False)
+    assert [path.relative_to(tmp_path).as_posix() for path in found] == [
+        'lib/pages/info_page.dart',
+        'lib/pages/widgets/dialog.dart',
+    ]
+
+
+def test_cached_walk_sees_new_files(tmp_path):
+    _write(tmp_path, {'lib/a.dart': ''})
+    assert walk(tmp_path) == ['lib/a.dart']
+    assert (tmp_path / '.codemod_cache' / 'discovery.json').exists()
+
+    _write(tmp_path, {'lib/b.dart': ''})
+    assert walk(tmp_path) == ['lib/a.dart', 'lib/b.dart']
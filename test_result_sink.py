@@ -0,0 +1,64 @@
+"""Checks for the JSONL result sink"""
+
+import json
+
+from file_discovery import REPO_ROOT
+from result_sink import ResultSink, diff_results, load_results, main, pop_results_option
+
+
+def test_pop_results_option():
+    assert pop_results_option(['--jobs', '4', '--results', 'out.jsonl']) == ('out.jsonl', ['--jobs', '4'])
+    assert pop_results_option(['--jobs', '4']) == (None, ['--jobs', '4'])
+
+
+def test_pop_results_option_without_value_is_left_in_args():
+    assert pop_results_option(['--results']) == (None, ['--results'])
+
+
+def _record(file, action, finding=None, duration_ms=1.0):
+    return {'file': file, 'rule': 'overflow-check', 'action': action,
+            'duration_ms': duration_ms, 'finding': finding}
+
+
+def test_diff_ignores_duration_and_order():
+    old = [_record('lib/a.dart', 'ok'), _record('lib/b.dart', 'finding', 'Row overflow', 2.0)]
+    new = [_record('lib/b.dart', 'finding', 'Row overflow', 9.0), _record('lib/a.dart', 'ok', duration_ms=5.0)]
+    assert diff_results(old, new) == ([], [])
+
+
+def test_diff_reports_removed_and_added():
+    old = [_record('lib/a.dart', 'finding', 'Row overflow'), _record('lib/b.dart', 'ok')]
+    new = [_record('lib/a.dart', 'ok'), _record('lib/b.dart', 'ok'), _record('lib/c.dart', 'ok')]
+    removed, added = diff_results(old, new)
+    assert removed == [('lib/a.dart', 'overflow-check', 'finding', 'Row overflow')]
+    assert added == [('lib/a.dart', 'overflow-check', 'ok', ''), ('lib/c.dart', 'overflow-check', 'ok', '')]
+
+
+def test_diff_counts_duplicate_records():
+    old = [_record('lib/a.dart', 'finding', 'Row overflow')]
+    new = old * 2
+    assert diff_results(old, new) == ([], [('lib/a.dart', 'overflow-check', 'finding', 'Row overflow')])
+
+
+def test_sink_round_trip(tmp_path, capsys):
+    path = tmp_path / 'results.jsonl'
+    with ResultSink('overflow-check', path) as sink:
+        sink.run(lambda filepath: [('ok', None)] if filepath.stem == 'a' else [('finding', 'Row overflow')],
+                 [REPO_ROOT / 'lib' / 'a.dart', REPO_ROOT / 'lib' / 'b.dart'])
+
+    records = load_results(path)
+    assert [(r['file'], r['action'], r['finding']) for r in records] == [
+        ('lib/a.dart', 'ok', None),
+        ('lib/b.dart', 'finding', 'Row overflow'),
+    ]
+    assert 'finding: 1, ok: 1 across 2 files' in capsys.readouterr().out
+
+
+def test_main_diff_exit_code(tmp_path):
+    old, new = tmp_path / 'old.jsonl', tmp_path / 'new.jsonl'
+    old.write_text(json.dumps(_record('lib/a.dart', 'ok')) + '\n')
+    new.write_text(json.dumps(_record('lib/a.dart', 'ok', duration_ms=7.0)) + '\n')
+    assert main(['diff', str(old), str(new)]) == 0
+
+    new.write_text(json.dumps(_record('lib/a.dart', 'error', 'boom')) + '\n')
+    assert main(['diff', str(old), str(new)]) == 1
@@ -3,12 +3,22 @@
 Update all app icon references to use shield_logo3.png
 """
 
-import os
+import functools
 import re
-from pathlib import Path
+import sys
 
-def update_icon_references(filepath):
-    """Update app_icon.png and shield_logo.png references to shield_logo3.png"""
+from codemod_journal import Journal
+from file_discovery import discover
+from result_sink import ResultSink, pop_results_option
+
+# shield_logo.png, but not shield_logo3.png
+OLD_SHIELD_PATTERN = re.compile(r'shield_logo\.png(?!3)')
+
+def update_icon_references(filepath, journal):
+    """
+    Update app_icon.png and shield_logo.png references to shield_logo3.png;
+    return [(action, finding)]
+    """
     try:
         with open(filepath, 'r', encoding='utf-8') as f:
             content = f.read()
@@ -19,39 +29,29 @@ def update_icon_references(filepath):
         content = content.replace('app_icon.png', 'shield_logo3.png')
 
         # Replace shield_logo.png with shield_logo3.png (but not shield_logo3.png)
-        content = re.sub(r'shield_logo\.png(?!3)', 'shield_logo3.png', content)
+        content = OLD_SHIELD_PATTERN.sub('shield_logo3.png', content)
 
         if content != original_content:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(content)
-            print(f"  Updated: {filepath.name}")
-            return True
+            journal.write_text(filepath, content)
+            return [('updated', None)]
         else:
-            return False
+            return [('skipped', None)]
 
     except Exception as e:
-        print(f"  ERROR: {filepath.name}: {e}")
-        return False
+        return [('error', str(e))]
 
-def main():
-    pages_dir = Path('lib/pages')
-
-    if not pages_dir.exists():
-        print("Error: lib/pages directory not found")
-        return
+def main(argv=None):
+    results, args = pop_results_option(sys.argv[1:] if argv is None else argv)
+    if args:
+        print("Usage: python update_app_icons.py [--results PATH]")
+        return 2
 
     print("Updating app icon references to shield_logo3.png...")
-    print()
-
-    dart_files = list(pages_dir.glob('*.dart'))
-    updated_count = 0
 
-    for filepath in sorted(dart_files):
-        if update_icon_references(filepath):
-            updated_count += 1
+    dart_files = discover('icons')
 
-    print()
-    print(f"Summary: Updated {updated_count} out of {len(dart_files)} pages")
+    with Journal('update_app_icons') as journal, ResultSink('icons', results) as sink:
+        sink.run(functools.partial(update_icon_references, journal=journal), dart_files)
 
 if __name__ == '__main__':
-    main()
+    sys.exit(main())